@@ -4,13 +4,18 @@
 # because the latest Databricks Runtime does not contain legacy databricks CLI
 # but MLflow still depends on it.
 
+import io
 import os
+import re
 import sys
+import tempfile
+import threading
 from abc import ABCMeta, abstractmethod
 from configparser import ConfigParser
 from os.path import expanduser, join
 
 _home = expanduser("~")
+_DEFAULT_CONFIG_PATH = join(_home, ".databrickscfg")
 CONFIG_FILE_ENV_VAR = "DATABRICKS_CONFIG_FILE"
 HOST = "host"
 USERNAME = "username"
@@ -21,9 +26,16 @@ INSECURE = "insecure"
 JOBS_API_VERSION = "jobs-api-version"
 DEFAULT_SECTION = "DEFAULT"
 
+# Sentinel for lazily resolved values that may legitimately be None
+_UNSET = object()
+
 # User-provided override for the DatabricksConfigProvider
 _config_provider = None
 
+# Parsed config files keyed by path, each entry is ((st_mtime_ns, st_size), sections dict)
+_parsed_cache = {}
+_parsed_cache_lock = threading.Lock()
+
 
 class InvalidConfigurationError(RuntimeError):
     @staticmethod
@@ -41,12 +53,107 @@ class InvalidConfigurationError(RuntimeError):
 
 
 def _get_path():
-    return os.environ.get(CONFIG_FILE_ENV_VAR, join(_home, ".databrickscfg"))
+    return os.environ.get(CONFIG_FILE_ENV_VAR, _DEFAULT_CONFIG_PATH)
 
 
-def _fetch_from_fs():
+class _FastIni:
+    """
+    Minimal reader for the databrickscfg file, which only holds a handful of ``key = value``
+    options per profile. Returns a ``{section: {option: value}}`` dict with option names
+    lowercased like ``ConfigParser`` does.
+
+    Only plain section headers, options and comments are handled directly. Files containing
+    ``%`` (which ``ConfigParser`` interpolates) or any other kind of line (indented continuation
+    lines, duplicate sections or options, malformed lines) go through ``ConfigParser`` instead,
+    so values and parse errors match it. Interpolation errors are raised when the file is read
+    rather than when the affected option is looked up.
+    """
+
+    # Same patterns as ConfigParser.SECTCRE and ConfigParser.OPTCRE
+    _SECTION_RE = re.compile(r"\[(?P<header>.+)\]")
+    _KV_RE = re.compile(r"(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$")
+
+    @classmethod
+    def parse(cls, text, source="<string>"):
+        if "%" in text:
+            return cls._parse_with_config_parser(text, source)
+        sections = {}
+        current = None
+        # Iterate like ConfigParser.read_string, which only splits on "\n"
+        for line in io.StringIO(text):
+            stripped = line.strip()
+            if not stripped or stripped[0] in "#;":
+                continue
+            if line[0].isspace():
+                return cls._parse_with_config_parser(text, source)
+            m = cls._SECTION_RE.match(stripped)
+            if m:
+                name = m.group("header")
+                if name in sections:
+                    return cls._parse_with_config_parser(text, source)
+                current = sections[name] = {}
+                continue
+            m = cls._KV_RE.match(stripped)
+            if m is None or current is None or not m.group("option"):
+                return cls._parse_with_config_parser(text, source)
+            option = m.group("option").lower()
+            if option in current:
+                return cls._parse_with_config_parser(text, source)
+            current[option] = m.group("value")
+        if not sections.get(DEFAULT_SECTION, True):
+            del sections[DEFAULT_SECTION]
+        return sections
+
+    @staticmethod
+    def _parse_with_config_parser(text, source):
+        raw_config = ConfigParser()
+        raw_config.read_string(text, source)
+        sections = {}
+        if raw_config.defaults():
+            sections[DEFAULT_SECTION] = {
+                option: raw_config.get(DEFAULT_SECTION, option) for option in raw_config.defaults()
+            }
+        # Use _sections to avoid including inherited DEFAULT options.
+        for name, options in raw_config._sections.items():
+            sections[name] = {option: raw_config.get(name, option) for option in options}
+        return sections
+
+    @classmethod
+    def read(cls, path):
+        with open(path) as f:
+            return cls.parse(f.read(), path)
+
+
+def _parse_config(path):
     raw_config = ConfigParser()
-    raw_config.read(_get_path())
+    raw_config.read(path)
+    return raw_config
+
+
+def _fetch_from_fs():
+    """
+    Returns the parsed config file as a ``{section: {option: value}}`` dict. The parsed result
+    is cached and reused as long as the file's modification time and size are unchanged, so
+    callers must not mutate it.
+    """
+    path = _get_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    with _parsed_cache_lock:
+        cached = _parsed_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    try:
+        raw_config = _FastIni.read(path)
+    except OSError:
+        return {}
+    with _parsed_cache_lock:
+        _parsed_cache[path] = (key, raw_config)
     return raw_config
 
 
@@ -55,17 +162,6 @@ def _create_section_if_absent(raw_config, profile):
         raw_config.add_section(profile)
 
 
-def _get_option_if_exists(raw_config, profile, option):
-    if profile == DEFAULT_SECTION:
-        # We must handle the DEFAULT_SECTION differently since it is not in the _sections property
-        # of raw config.
-        return raw_config.get(profile, option) if raw_config.has_option(profile, option) else None
-    # Check if option is defined in the profile.
-    elif option not in raw_config._sections.get(profile, {}).keys():
-        return None
-    return raw_config.get(profile, option)
-
-
 def _set_option(raw_config, profile, option, value):
     if value:
         raw_config.set(profile, option, value)
@@ -75,17 +171,33 @@ def _set_option(raw_config, profile, option, value):
 
 def _overwrite_config(raw_config):
     config_path = _get_path()
-    # Create config file with owner only rw permissions
-    if not os.path.exists(config_path):
-        file_descriptor = os.open(config_path, os.O_CREAT | os.O_RDWR, 0o600)
-        os.close(file_descriptor)
-
-    # Change file permissions to owner only rw if that's not the case
-    if not os.stat(config_path).st_mode == 0o100600:
-        os.chmod(config_path, 0o600)
+    # Resolve symlinks so that a linked config file is updated instead of replaced by a copy
+    real_path = os.path.realpath(config_path)
+
+    # Write to a uniquely named temporary file, created with owner only rw permissions, and move
+    # it into place, so that the config file is never observed partially written.
+    file_descriptor, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(real_path) + ".", dir=os.path.dirname(real_path)
+    )
+    try:
+        # Render the whole file in memory so it is written with a single call
+        buf = io.StringIO()
+        raw_config.write(buf)
+        with os.fdopen(file_descriptor, "w") as cfg:
+            cfg.write(buf.getvalue())
+            # Make sure the data is on disk before the rename, which may be persisted first
+            cfg.flush()
+            os.fsync(cfg.fileno())
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
-    with open(config_path, "w") as cfg:
-        raw_config.write(cfg)
+    with _parsed_cache_lock:
+        _parsed_cache.pop(config_path, None)
 
 
 def update_and_persist_config(profile, databricks_config):
@@ -98,7 +210,8 @@ def update_and_persist_config(profile, databricks_config):
         databricks_config: DatabricksConfig
     """
     profile = profile if profile else DEFAULT_SECTION
-    raw_config = _fetch_from_fs()
+    # Parse a fresh copy since the cached one returned by _fetch_from_fs is shared
+    raw_config = _parse_config(_get_path())
     _create_section_if_absent(raw_config, profile)
     _set_option(raw_config, profile, HOST, databricks_config.host)
     _set_option(raw_config, profile, USERNAME, databricks_config.username)
@@ -118,16 +231,17 @@ def get_config():
 
     If no DatabricksConfig can be found, an InvalidConfigurationError will be raised.
     """
-    global _config_provider
-    if _config_provider:
-        config = _config_provider.get_config()
+    # Read the provider once so a concurrent set_config_provider() can't swap it mid-call
+    provider = _config_provider
+    if provider:
+        config = provider.get_config()
         if config:
             return config
         raise InvalidConfigurationError(
-            "Custom provider returned no DatabricksConfig: %s" % _config_provider
+            "Custom provider returned no DatabricksConfig: %s" % provider
         )
 
-    config = DefaultConfigProvider().get_config()
+    config = _DEFAULT_PROVIDER.get_config()
     if config:
         return config
     raise InvalidConfigurationError.for_profile(None)
@@ -177,7 +291,6 @@ def get_config_provider():
     Returns the current DatabricksConfigProvider.
     If None, the DefaultConfigProvider will be used.
     """
-    global _config_provider
     return _config_provider
 
 
@@ -199,12 +312,9 @@ class DatabricksConfigProvider:
 class DefaultConfigProvider(DatabricksConfigProvider):
     """Look for credentials in a chain of default locations."""
 
-    def __init__(self):
-        self._providers = (
-            SparkTaskContextConfigProvider(),
-            EnvironmentVariableConfigProvider(),
-            ProfileConfigProvider(),
-        )
+    # The providers are stateless, so a single chain is shared by all instances. It is assigned
+    # below, once the provider classes are defined.
+    _providers = ()
 
     def get_config(self):
         for provider in self._providers:
@@ -217,14 +327,21 @@ class DefaultConfigProvider(DatabricksConfigProvider):
 class SparkTaskContextConfigProvider(DatabricksConfigProvider):
     """Loads credentials from Spark TaskContext if running in a Spark Executor."""
 
-    @staticmethod
-    def _get_spark_task_context_or_none():
-        try:
-            from pyspark import TaskContext  # pylint: disable=import-error
+    # pyspark.TaskContext, or None if pyspark is unavailable. Resolved on first use.
+    _task_context_cls = _UNSET
 
-            return TaskContext.get()
-        except ImportError:
+    @classmethod
+    def _get_spark_task_context_or_none(cls):
+        if cls._task_context_cls is _UNSET:
+            try:
+                from pyspark import TaskContext  # pylint: disable=import-error
+
+                cls._task_context_cls = TaskContext
+            except ImportError:
+                cls._task_context_cls = None
+        if cls._task_context_cls is None:
             return None
+        return cls._task_context_cls.get()
 
     @staticmethod
     def set_insecure(x):
@@ -273,14 +390,15 @@ class ProfileConfigProvider(DatabricksConfigProvider):
         self.profile = profile
 
     def get_config(self):
-        raw_config = _fetch_from_fs()
-        host = _get_option_if_exists(raw_config, self.profile, HOST)
-        username = _get_option_if_exists(raw_config, self.profile, USERNAME)
-        password = _get_option_if_exists(raw_config, self.profile, PASSWORD)
-        token = _get_option_if_exists(raw_config, self.profile, TOKEN)
-        refresh_token = _get_option_if_exists(raw_config, self.profile, REFRESH_TOKEN)
-        insecure = _get_option_if_exists(raw_config, self.profile, INSECURE)
-        jobs_api_version = _get_option_if_exists(raw_config, self.profile, JOBS_API_VERSION)
+        # Options of the DEFAULT section are intentionally not inherited by other profiles.
+        opts = _fetch_from_fs().get(self.profile, {})
+        host = opts.get(HOST)
+        username = opts.get(USERNAME)
+        password = opts.get(PASSWORD)
+        token = opts.get(TOKEN)
+        refresh_token = opts.get(REFRESH_TOKEN)
+        insecure = opts.get(INSECURE)
+        jobs_api_version = opts.get(JOBS_API_VERSION)
         config = DatabricksConfig(
             host, username, password, token, refresh_token, insecure, jobs_api_version
         )
@@ -289,7 +407,27 @@ class ProfileConfigProvider(DatabricksConfigProvider):
         return None
 
 
+DefaultConfigProvider._providers = (
+    SparkTaskContextConfigProvider(),
+    EnvironmentVariableConfigProvider(),
+    ProfileConfigProvider(),
+)
+
+# Shared instance used by get_config() when no custom provider is set
+_DEFAULT_PROVIDER = DefaultConfigProvider()
+
+
 class DatabricksConfig:
+    __slots__ = (
+        "host",
+        "username",
+        "password",
+        "token",
+        "refresh_token",
+        "insecure",
+        "jobs_api_version",
+    )
+
     def __init__(
         self,
         host,
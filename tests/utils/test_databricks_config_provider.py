@@ -0,0 +1,258 @@
+import configparser
+import os
+import sys
+from configparser import ConfigParser
+from unittest import mock
+
+import pytest
+
+from mlflow.legacy_databricks_cli.configure import provider
+from mlflow.legacy_databricks_cli.configure.provider import (
+    DEFAULT_SECTION,
+    DatabricksConfig,
+    EnvironmentVariableConfigProvider,
+    ProfileConfigProvider,
+    SparkTaskContextConfigProvider,
+    _FastIni,
+    _fetch_from_fs,
+    get_config,
+    update_and_persist_config,
+)
+from mlflow.utils.os import is_windows
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path.joinpath(".databrickscfg")
+    monkeypatch.setenv("DATABRICKS_CONFIG_FILE", str(path))
+    monkeypatch.setattr(provider, "_parsed_cache", {})
+    return path
+
+
+def test_read_edit_read_picks_up_changes(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t1\n")
+    config = ProfileConfigProvider().get_config()
+    assert (config.host, config.token) == ("https://a", "t1")
+
+    config_file.write_text("[DEFAULT]\nhost = https://b\ntoken = token2\n")
+    config = ProfileConfigProvider().get_config()
+    assert (config.host, config.token) == ("https://b", "token2")
+
+
+def test_same_size_edit_with_new_mtime_is_reparsed(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t1\n")
+    assert ProfileConfigProvider().get_config().token == "t1"
+
+    st = os.stat(config_file)
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t2\n")
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert ProfileConfigProvider().get_config().token == "t2"
+
+
+def test_unchanged_file_is_parsed_once(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t\n")
+    with mock.patch.object(_FastIni, "read", wraps=_FastIni.read) as read_mock:
+        first = _fetch_from_fs()
+        second = _fetch_from_fs()
+    assert first is second
+    read_mock.assert_called_once()
+
+
+def test_missing_file_returns_no_config(config_file):
+    assert _fetch_from_fs() == {}
+    assert ProfileConfigProvider().get_config() is None
+
+
+def test_write_then_read(config_file):
+    update_and_persist_config(None, DatabricksConfig.from_token("https://a", "t"))
+    update_and_persist_config(
+        "prof", DatabricksConfig.from_password("https://b", "user", "pass", jobs_api_version="2.1")
+    )
+
+    config = ProfileConfigProvider().get_config()
+    assert (config.host, config.token) == ("https://a", "t")
+    config = ProfileConfigProvider("prof").get_config()
+    assert (config.host, config.username, config.password, config.token) == (
+        "https://b",
+        "user",
+        "pass",
+        None,
+    )
+    assert config.jobs_api_version == "2.1"
+    assert oct(os.stat(config_file).st_mode & 0o777) == oct(0o600)
+
+
+def test_write_invalidates_cache_and_does_not_mutate_cached_config(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t1\n")
+    cached = _fetch_from_fs()
+
+    update_and_persist_config(None, DatabricksConfig.from_token("https://a", "t2"))
+
+    assert cached == {"DEFAULT": {"host": "https://a", "token": "t1"}}
+    assert str(config_file) not in provider._parsed_cache
+    assert ProfileConfigProvider().get_config().token == "t2"
+
+
+def _parse_with_config_parser(text):
+    # Read every option the way the original ConfigParser-based provider did: with the default
+    # interpolation, and without inheriting DEFAULT options into other profiles.
+    raw_config = ConfigParser()
+    raw_config.read_string(text)
+    sections = {
+        name: {option: raw_config.get(name, option) for option in raw_config._sections[name]}
+        for name in raw_config.sections()
+    }
+    if raw_config.defaults():
+        sections[DEFAULT_SECTION] = {
+            option: raw_config.get(DEFAULT_SECTION, option) for option in raw_config.defaults()
+        }
+    return sections
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[DEFAULT]\n",
+        "# comment\n[DEFAULT]\nHost = https://a:443/x\ntoken=dapi123\n  ; indented comment\n",
+        "[p q]\nusername : me\npassword = a=b\njobs-api-version =\n",
+        "[DEFAULT]\nhost=https://default\ntoken=dtok\n"
+        "[staging] ; staging workspace\nhost=https://staging\ntoken=stok\n",
+        "[a]b]\nhost = h\n",
+        "[DEFAULT]\nhost = h\n  token = x\n",
+        "[a]\nhost = h\n\n\tmore\ntoken = t\n",
+        "  [a]\n  host = h\n",
+        "[DEFAULT]\ntoken = abc%%def\n",
+        "[DEFAULT]\nhost = h\ntoken = x%(host)s\n[a]\ntoken = y%(host)s\n",
+        "[DEFAULT]\ntoken = ab\x1dc=d\nhost = h\u2028x\x85y\n",
+        "[a]\r\nhost = h\r\ntoken = t\r\n",
+    ],
+)
+def test_fast_ini_matches_config_parser(text):
+    assert _FastIni.parse(text) == _parse_with_config_parser(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[a]\nhost = h\n[a]\ntoken = t\n",
+        "[a]\nhost = h\nHOST = h2\n",
+        "[a]\nno delimiter\n",
+        "host = h\n[a]\n",
+        "[a]\n= value\n",
+        "[a]\npassword = a=b%c\n",
+        "[a]\ntoken = x%(missing)s\n",
+    ],
+)
+def test_fast_ini_raises_like_config_parser(text):
+    with pytest.raises(configparser.Error, match=".+") as expected:
+        _parse_with_config_parser(text)
+    with pytest.raises(type(expected.value)):
+        _FastIni.parse(text)
+
+
+def test_escaped_percent_is_unescaped_when_read(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = abc%%def\n")
+    assert ProfileConfigProvider().get_config().token == "abc%def"
+
+
+def test_spark_task_context_class_is_resolved_once(monkeypatch):
+    monkeypatch.setattr(SparkTaskContextConfigProvider, "_task_context_cls", provider._UNSET)
+    task_context = mock.MagicMock()
+    task_context.get.return_value = None
+    fake_pyspark = mock.MagicMock(TaskContext=task_context)
+    monkeypatch.setitem(sys.modules, "pyspark", fake_pyspark)
+
+    assert SparkTaskContextConfigProvider().get_config() is None
+    assert SparkTaskContextConfigProvider._task_context_cls is task_context
+
+    # Later calls use the cached class without importing pyspark again
+    monkeypatch.setitem(sys.modules, "pyspark", None)
+    properties = {
+        "spark.databricks.api.url": "https://a",
+        "spark.databricks.token": "t",
+        "spark.databricks.ignoreTls": None,
+    }
+    task_context.get.return_value = mock.MagicMock()
+    task_context.get.return_value.getLocalProperty.side_effect = properties.get
+    config = SparkTaskContextConfigProvider().get_config()
+    assert (config.host, config.token) == ("https://a", "t")
+    assert task_context.get.call_count == 2
+
+
+def test_spark_task_context_missing_pyspark_is_cached(monkeypatch):
+    monkeypatch.setattr(SparkTaskContextConfigProvider, "_task_context_cls", provider._UNSET)
+    monkeypatch.setitem(sys.modules, "pyspark", None)
+
+    assert SparkTaskContextConfigProvider().get_config() is None
+    assert SparkTaskContextConfigProvider._task_context_cls is None
+
+
+def test_environment_config_is_not_shared_between_calls(monkeypatch):
+    monkeypatch.setenvs({"DATABRICKS_HOST": "https://a", "DATABRICKS_TOKEN": "t"})
+    first = EnvironmentVariableConfigProvider().get_config()
+    first.host = None
+
+    second = EnvironmentVariableConfigProvider().get_config()
+    assert second is not first
+    assert second.host == "https://a"
+
+
+def test_profile_config_is_not_shared_between_calls(config_file, monkeypatch):
+    monkeypatch.delenvs(("DATABRICKS_HOST", "DATABRICKS_TOKEN"), raising=False)
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t\n")
+    first = get_config()
+    first.host = None
+
+    second = get_config()
+    assert second is not first
+    assert second.host == "https://a"
+    assert second.is_valid
+
+
+def test_databricks_config_validity_follows_attribute_changes():
+    config = DatabricksConfig.from_token("https://a", "t")
+    assert config.is_valid
+    config.host = None
+    assert not config.is_valid_with_token
+    assert not config.is_valid
+    config.host = "https://a"
+    config.token = None
+    config.username, config.password = "user", "pass"
+    assert config.is_valid_with_password
+    assert config.is_valid
+
+
+@pytest.mark.skipif(is_windows(), reason="Creating symlinks requires privileges on Windows")
+def test_write_updates_symlink_target(tmp_path, monkeypatch):
+    target = tmp_path.joinpath("dotfiles", "databrickscfg")
+    target.parent.mkdir()
+    target.write_text("[DEFAULT]\nhost = https://old\ntoken = old\n")
+    link = tmp_path.joinpath(".databrickscfg")
+    link.symlink_to(target)
+    monkeypatch.setenv("DATABRICKS_CONFIG_FILE", str(link))
+
+    update_and_persist_config(None, DatabricksConfig.from_token("https://new", "new"))
+
+    assert link.is_symlink()
+    assert target.read_text() == "[DEFAULT]\nhost = https://new\ntoken = new\n\n"
+    assert sorted(p.name for p in target.parent.iterdir()) == ["databrickscfg"]
+
+
+def test_failed_write_keeps_config_and_removes_temp_file(config_file):
+    config_file.write_text("[DEFAULT]\nhost = https://a\ntoken = t\n")
+    with mock.patch("os.replace", side_effect=OSError("replace failed")):
+        with pytest.raises(OSError, match="replace failed"):
+            update_and_persist_config(None, DatabricksConfig.from_token("https://b", "t2"))
+
+    assert config_file.read_text() == "[DEFAULT]\nhost = https://a\ntoken = t\n"
+    assert [p.name for p in config_file.parent.iterdir()] == [config_file.name]
+
+
+def test_write_is_synced_before_replace(config_file):
+    calls = []
+    with mock.patch("os.fsync", side_effect=lambda fd: calls.append("fsync")), mock.patch(
+        "os.replace", side_effect=lambda *args: calls.append("replace") or os.rename(*args)
+    ):
+        update_and_persist_config(None, DatabricksConfig.from_token("https://a", "t"))
+    assert calls == ["fsync", "replace"]